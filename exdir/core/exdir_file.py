@@ -153,6 +153,11 @@ class File(Group):
             self.name_validation(directory.parent, directory.name)
             exob._create_object_directory(directory, exob._default_metadata(exob.FILE_TYPENAME))
 
+        # detected once per file, the objects inside are on the same file system
+        self._case_insensitive_fs = (
+            validation._IS_WINDOWS or validation._is_case_insensitive(directory)
+        )
+
     def close(self):
         """
         Closes the File object.
@@ -193,6 +198,21 @@ class File(Group):
 
         return super().create_group(path)
 
+    def create_groups(self, names):
+        """
+        Create several groups with the given names or absolute paths at once.
+
+        See :class:`.Group` for more details.
+
+        Note
+        ----
+        Creating groups with absolute paths is only allowed on File objects and
+        not on Group objects in general.
+        """
+        paths = [utils.path.remove_root(name) for name in names]
+
+        return super().create_groups(paths)
+
     def require_group(self, name):
         """
         Open an existing subgroup or create one if it does not exist.
@@ -11,6 +11,7 @@ import exdir
 from .attribute import Attribute
 from .constants import *
 from .mode import assert_file_open, OpenMode
+from . import validation
 
 
 def _resolve_path(path):
@@ -19,7 +20,28 @@ def _resolve_path(path):
 
 def _assert_valid_name(name, container):
     """Check if name (dataset or group) is valid."""
-    container.file.name_validation(container.directory, name)
+    name_validation = container.file.name_validation
+    # skip building the directory path when there is nothing to validate
+    if name_validation is validation.none:
+        return
+    if name_validation is validation.thorough:
+        # the file system was checked for case sensitivity when the file was opened
+        validation.thorough(
+            container.directory, name,
+            case_insensitive_fs=container.file._case_insensitive_fs
+        )
+        return
+    name_validation(container.directory, name)
+
+
+def _assert_valid_names(names, container):
+    """Check if several names (datasets or groups) are valid together."""
+    name_validation = container.file.name_validation
+    if name_validation is not validation.none:
+        validation.validate_many(
+            container.directory, names, name_validation,
+            case_insensitive_fs=container.file._case_insensitive_fs
+        )
 
 
 def _create_object_directory(directory, metadata):
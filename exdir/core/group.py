@@ -184,6 +184,68 @@ class Group(Object):
         exob._create_object_directory(group_directory, exob._default_metadata(exob.GROUP_TYPENAME))
         return self._group(name)
 
+    def create_groups(self, names):
+        """
+        Create several groups at once. This is equivalent to calling
+        `create_group` for each name, but all names are validated, and checked
+        against existing objects and each other, before any group is created.
+        This is considerably faster for many groups.
+
+        Parameters
+        ----------
+        names: iterable of str
+            Names of the subgroups. Must follow the naming convention of the
+            parent Exdir File. Nested paths are not supported.
+
+        Raises
+        ------
+        RuntimeError
+            If the naming rule of the parent Exdir File finds that one of the
+            `names` already exists, or that a name is given more than once.
+        NameError
+            If one of the `names` is not allowed by the naming rule of the
+            parent Exdir File.
+        FileExistsError
+            If an object with one of the `names` already exists, or if a name
+            is given more than once, and the naming rule did not catch it.
+        NotImplementedError
+            If one of the `names` is a nested path.
+
+        Returns
+        -------
+        A list of the newly created Groups.
+
+        See also
+        --------
+        create_group
+        """
+        assert_file_writable(self.file)
+        names = list(names)
+        paths = [utils.path.name_to_asserted_group_path(name) for name in names]
+        for name, path in zip(names, paths):
+            if len(path.parts) > 1:
+                raise NotImplementedError(
+                    f"Nested path '{name}' is not supported by create_groups, "
+                    "use create_group instead."
+                )
+
+        exob._assert_valid_names(paths, self)
+
+        seen = set()
+        for name, path in zip(names, paths):
+            if name in self or path in seen:
+                raise FileExistsError(
+                    f"'{name}' already exists in '{self.name}'"
+                )
+            seen.add(path)
+
+        groups = []
+        for name, path in zip(names, paths):
+            group_directory = self.directory / path
+            exob._create_object_directory(group_directory, exob._default_metadata(exob.GROUP_TYPENAME))
+            groups.append(self._group(name))
+        return groups
+
     def _group(self, name):
         return Group(
             root_directory=self.root_directory,
@@ -1,7 +1,6 @@
 from enum import Enum
 import os
 import sys
-from pathlib import Path, WindowsPath
 from unicodedata import category
 from . import constants as exob
 
@@ -12,7 +11,20 @@ from . import constants as exob
 if sys.version_info.minor < 13:
     from pathlib import PureWindowsPath
 
+    # superset of the device names checked by `PureWindowsPath.is_reserved`
+    _WINDOWS_RESERVED_NAMES = frozenset(
+        ["CON", "PRN", "AUX", "NUL", "CONIN$", "CONOUT$"]
+        + [f"COM{c}" for c in "123456789\xb9\xb2\xb3"]
+        + [f"LPT{c}" for c in "123456789\xb9\xb2\xb3"]
+    )
+
     def _is_reserved(path):
+        if not any(sep in path for sep in "/\\:"):
+            # a single path component, so only the part before the first dot
+            # decides whether `PureWindowsPath` would consider it reserved
+            stem = path.partition(".")[0].rstrip(" ").upper()
+            if stem not in _WINDOWS_RESERVED_NAMES:
+                return _contains_control_character(path)
         return PureWindowsPath(path).is_reserved() or _contains_control_character(path)
 else:
     from ntpath import isreserved
@@ -20,8 +32,25 @@ else:
     def _is_reserved(path):
         return isreserved(path) or _contains_control_character(path)
 
+_IS_WINDOWS = os.name == "nt"
+
 VALID_CHARACTERS = ("abcdefghijklmnopqrstuvwxyz1234567890_-.")
 
+# translation table that deletes all valid characters, leaving only invalid ones
+_DELETE_VALID_CHARACTERS = str.maketrans("", "", VALID_CHARACTERS)
+
+_RESERVED_NAMES = frozenset([
+    exob.META_FILENAME,
+    exob.ATTRIBUTES_FILENAME,
+    exob.RAW_FOLDER_NAME
+])
+# lets most names skip hashing before the set lookup
+_RESERVED_NAME_LENGTHS = frozenset(len(name) for name in _RESERVED_NAMES)
+
+# names that os.path.lexists finds in every directory, even though
+# os.listdir never lists them ("" and "." are the directory itself)
+_ALWAYS_EXISTING_NAMES = frozenset(["", ".", ".."])
+
 
 class NamingRule(Enum):
     SIMPLE = 1
@@ -31,45 +60,81 @@ class NamingRule(Enum):
 
 
 def _contains_control_character(s):
+    # every character in category "C" is non-printable, so only names with
+    # non-printable characters need to be checked one character at a time
+    if s.isprintable():
+        return False
+    if s.isascii():
+        # the only non-printable ASCII characters are the control characters
+        return True
     return any(ch for ch in s if category(ch)[0] == "C")
 
 
-def _assert_unique(parent_path, name):
-    try:
-        name_str = str(name)
-    except UnicodeEncodeError:
-        name = name.encode('utf8')
+def _path_already_exists_case_insensitive(parent_path, name_casefold):
+    # os.listdir is much faster here than os.walk or parent_path.iterdir, and
+    # than os.scandir, since only the names are needed
+    return any(name_casefold == item.casefold() for item in os.listdir(parent_path))
 
-    if (parent_path / name).exists():
-        raise RuntimeError(
-            f"'{name}' already exists in '{parent_path}'"
+
+def _is_case_insensitive(directory):
+    # every Exdir object directory contains the meta file, so if it can also
+    # be found by its upper case name, lookups in this directory ignore case
+    # NOTE directories without the meta file are treated as case sensitive,
+    # which is always safe, but slower
+    meta_path = os.path.join(directory, exob.META_FILENAME)
+    try:
+        return os.path.samefile(
+            meta_path,
+            os.path.join(directory, exob.META_FILENAME.upper())
         )
+    except OSError:
+        return False
 
 
-def _assert_nonempty(parent_path, name):
-    try:
-        name_str = str(name)
-    except UnicodeEncodeError:
-        name_str = name.encode('utf8')
+# NOTE the _assert_* helpers expect a name that has already been converted
+# to str, so that it is converted only once per validation
 
-    if len(name_str) < 1:
-        raise NameError("Name cannot be empty.")
+def _not_unique_error(parent_path, name_str):
+    return RuntimeError(
+        f"'{name_str}' already exists in '{parent_path}'"
+    )
 
 
-def _assert_nonreserved(name):
-    # NOTE ignore unicode errors, they are not reserved
-    try:
-        name_str = str(name)
-    except UnicodeEncodeError:
-        name_str = name.encode('utf8')
+def _not_unique_case_insensitive_error(name_str):
+    return RuntimeError(
+        f"A directory with name (case independent) '{name_str}' already exists "
+        " and cannot be made according to the naming rule 'thorough'."
+    )
+
+
+def _assert_unique(parent_path, name_str):
+    if os.path.lexists(os.path.join(parent_path, name_str)):
+        raise _not_unique_error(parent_path, name_str)
+
+
+def _assert_unique_case_insensitive(parent_path, name_str, case_insensitive_fs):
+    if case_insensitive_fs:
+        # use _assert_unique if the file system is case insensitive, like on
+        # Windows, because it is much faster than the test below
+        _assert_unique(parent_path, name_str)
+        return
+
+    if (name_str in _ALWAYS_EXISTING_NAMES
+            or _path_already_exists_case_insensitive(parent_path, name_str.casefold())):
+        raise _not_unique_case_insensitive_error(name_str)
 
-    reserved_names = [
-        exob.META_FILENAME,
-        exob.ATTRIBUTES_FILENAME,
-        exob.RAW_FOLDER_NAME
-    ]
 
-    if name_str in reserved_names:
+def _assert_nonempty(parent_path, name_str):
+    if len(name_str) < 1:
+        raise NameError("Name cannot be empty.")
+
+
+def _assert_nonreserved(name_str, _is_reserved=_is_reserved,
+                        _reserved_names=_RESERVED_NAMES,
+                        _reserved_name_lengths=_RESERVED_NAME_LENGTHS):
+    # NOTE the keyword defaults bind the module globals as locals, because this
+    # runs for every created object
+    if len(name_str) in _reserved_name_lengths and name_str in _reserved_names:
         raise NameError(
             f"Name cannot be '{name_str}' because it is a reserved filename in Exdir."
         )
@@ -79,59 +144,108 @@ def _assert_nonreserved(name):
             f"Name cannot be '{name_str}' because it is a reserved filename in Windows."
         )
 
-def _assert_valid_characters(name):
-    try:
-        name_str = str(name)
-    except UnicodeEncodeError:
-        name_str = name.encode('utf8')
+def _assert_valid_characters(name_str):
+    invalid_characters = name_str.translate(_DELETE_VALID_CHARACTERS)
+    if invalid_characters:
+        raise NameError(
+            f"Name '{name_str}' contains invalid character '{invalid_characters[0]}'.\n"
+            f"Valid characters are:\n{VALID_CHARACTERS}"
+        )
+
+
+# NOTE the _check_*_name helpers contain everything a naming rule checks
+# except uniqueness, so that validate_many can check uniqueness in bulk
+
+def _check_unique_name(parent_path, name_str):
+    _assert_nonempty(parent_path, name_str)
+
+
+def _check_minimal_name(parent_path, name_str):
+    _assert_nonempty(parent_path, name_str)
+    _assert_nonreserved(name_str)
+
+
+def _check_strict_name(parent_path, name_str):
+    _assert_nonreserved(name_str)
+    _assert_valid_characters(name_str)
+
+
+def _check_thorough_name(parent_path, name_str):
+    _assert_nonempty(parent_path, name_str)
+    _assert_nonreserved(name_str)
+    _assert_valid_characters(name_str.lower())
 
-    for char in name_str:
-        if char not in VALID_CHARACTERS:
-            raise NameError(
-                f"Name '{name_str}' contains invalid character '{char}'.\n"
-                f"Valid characters are:\n{VALID_CHARACTERS}"
-            )
 
 def unique(parent_path, name):
-    _assert_nonempty(parent_path, name)
-    _assert_unique(parent_path, name)
+    name_str = str(name)
+    _check_unique_name(parent_path, name_str)
+    _assert_unique(parent_path, name_str)
 
 
 def minimal(parent_path, name):
-    _assert_nonempty(parent_path, name)
-    _assert_nonreserved(name)
-    _assert_unique(parent_path, name)
+    name_str = str(name)
+    _check_minimal_name(parent_path, name_str)
+    _assert_unique(parent_path, name_str)
 
 
 def strict(parent_path, name):
-    _assert_nonreserved(name)
-    _assert_unique(parent_path, name)
-    _assert_valid_characters(name)
-
-def thorough(parent_path, name):
-    _assert_nonempty(parent_path, name)
-    _assert_nonreserved(name)
-    try:
-        name_str = str(name)
-    except UnicodeEncodeError:
-        name_str = name.encode('utf8')
-    name_lower = name_str.lower()
-    _assert_valid_characters(name_lower)
-
-    if isinstance(Path(parent_path), WindowsPath):
-        # use _assert_unique if we're already on Windows, because it is much faster
-        # than the test below
-        _assert_unique(parent_path, name)
-        return
+    name_str = str(name)
+    _check_strict_name(parent_path, name_str)
+    _assert_unique(parent_path, name_str)
 
-    # os.listdir is much faster here than os.walk or parent_path.iterdir
-    for item in os.listdir(str(parent_path)):
-        if name_lower == item.lower():
-            raise RuntimeError(
-                f"A directory with name (case independent) '{name}' already exists "
-                " and cannot be made according to the naming rule 'thorough'."
-            )
+def thorough(parent_path, name, case_insensitive_fs=_IS_WINDOWS):
+    name_str = str(name)
+    _check_thorough_name(parent_path, name_str)
+    _assert_unique_case_insensitive(parent_path, name_str, case_insensitive_fs)
 
 
 def none(parent_path, name):
     pass
+
+
+_NAME_CHECKS = {
+    unique: _check_unique_name,
+    minimal: _check_minimal_name,
+    strict: _check_strict_name,
+    thorough: _check_thorough_name,
+}
+
+
+def validate_many(parent_path, names, rule=thorough, case_insensitive_fs=_IS_WINDOWS):
+    """
+    Validate several new names in the same parent directory according to one
+    of the naming rules in this module.
+
+    The parent directory is only listed once, and the names are also checked
+    for uniqueness against each other. Rules that are not defined in this
+    module are called once per name. Set `case_insensitive_fs` if the parent
+    directory is on a case insensitive file system.
+    """
+    if rule is none:
+        return
+
+    check_name = _NAME_CHECKS.get(rule)
+    if check_name is None:
+        for name in names:
+            rule(parent_path, name)
+        return
+
+    # thorough scans the directory unless lexists already ignores case
+    scan = rule is thorough and not case_insensitive_fs
+    case_insensitive = scan or case_insensitive_fs
+    if case_insensitive:
+        existing = {item.casefold() for item in os.listdir(parent_path)}
+    else:
+        existing = set(os.listdir(parent_path))
+    existing.update(_ALWAYS_EXISTING_NAMES)
+
+    for name in names:
+        name_str = str(name)
+        check_name(parent_path, name_str)
+
+        key = name_str.casefold() if case_insensitive else name_str
+        if key in existing:
+            if scan:
+                raise _not_unique_case_insensitive_error(name_str)
+            raise _not_unique_error(parent_path, name_str)
+        existing.add(key)
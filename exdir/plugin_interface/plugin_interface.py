@@ -1,5 +1,6 @@
 import os
-import inspect
+from collections import defaultdict
+from collections.abc import Iterable
 
 
 class Plugin:
@@ -189,75 +190,56 @@ class Raw:
 
 
 def solve_plugin_order(plugins, read_mode=False):
-    available_plugins = plugins
-    enabled_plugins = [plugin._plugin_module.name for plugin in plugins]
+    enabled_plugins = {plugin._plugin_module.name for plugin in plugins}
 
     plugin_map = {}
-    dependency_map = {}
+    dependency_map = {plugin._plugin_module.name: set() for plugin in plugins}
 
-    for plugin in available_plugins:
-        plugin_map[plugin._plugin_module.name] = plugin
+    for plugin in plugins:
+        name = plugin._plugin_module.name
+        plugin_map[name] = plugin
         if read_mode:
-            original = plugin._plugin_module.read_after
+            after = plugin._plugin_module.read_after
+            before = plugin._plugin_module.read_before
         else:
-            original = plugin._plugin_module.write_after
+            after = plugin._plugin_module.write_after
+            before = plugin._plugin_module.write_before
 
-        new_set = set()
-        for other in original:
+        for other in after:
             if other in enabled_plugins:
-                new_set.add(other)
-        dependency_map[plugin._plugin_module.name] = new_set
-
-    for plugin in available_plugins:
-        if read_mode:
-            original = plugin._plugin_module.read_before
-        else:
-            original = plugin._plugin_module.write_before
-        for before in original:
-            if before in dependency_map:
-                dependency_map[before].add(plugin._plugin_module.name)
-
-    queue = set(enabled_plugins)
-    needed_plugins = set()
-    while queue:
-        new_queue = set()
-        for name in queue:
-            for dependency in dependency_map[name]:
-                new_queue.add(dependency)
-            needed_plugins.add(name)
-        queue = new_queue
-
-    # remove missing plugins from maps
-    plugin_map = {
-        name: v
-        for name, v in plugin_map.items()
-        if name in needed_plugins
-    }
-    dependency_map = {
-        name: v
-        for name, v in dependency_map.items()
-        if name in needed_plugins
-    }
+                dependency_map[name].add(other)
+
+        for other in before:
+            if other in dependency_map:
+                dependency_map[other].add(name)
+
+    # Kahn's algorithm: count unresolved dependencies per plugin and release
+    # plugins as soon as the last of their dependencies has been ordered.
+    # Plugins are released layer by layer, and within a layer in the order
+    # they were given, so that unconstrained plugins keep their order.
+    position = {name: index for index, name in enumerate(dependency_map)}
+    remaining = {}
+    dependents = defaultdict(list)
+    for name, dependencies in dependency_map.items():
+        remaining[name] = len(dependencies)
+        for dependency in dependencies:
+            dependents[dependency].append(name)
+
+    ready = [name for name, count in remaining.items() if count == 0]
 
     ordered_plugins = []
-    while dependency_map:
-        ready = [
-            name
-            for name, dependencies in dependency_map.items()
-            if not dependencies
-        ]
-
-        if not ready:
-            raise ValueError("Circular plugin dependency found!")
-
-        for name in ready:
-            del dependency_map[name]
-
-        for dependencies in dependency_map.values():
-            dependencies.difference_update(ready)
-
+    while ready:
+        next_ready = []
         for name in ready:
             ordered_plugins.append(plugin_map[name])
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    next_ready.append(dependent)
+        ready = sorted(next_ready, key=position.__getitem__)
+
+    if len(ordered_plugins) != len(plugin_map):
+        raise ValueError("Circular plugin dependency found!")
 
     return ordered_plugins
 
@@ -278,17 +260,17 @@ class Manager:
 
         if plugins is None:
             plugins = []
-
-        # make iterable if not already so
-        try:
-            _ = (e for e in plugins)
-        except TypeError:
+        elif not isinstance(plugins, Iterable):
+            # make iterable if not already so
             plugins = [plugins]
 
         self.plugins = []
         for plugin in plugins:
-            if inspect.ismodule(plugin):
-                self.plugins.extend(plugin.plugins())
+            # plugin modules, such as exdir.plugins.quantities, provide a
+            # plugins() function returning their Plugin instances
+            module_plugins = getattr(plugin, "plugins", None)
+            if callable(module_plugins) and not isinstance(plugin, Plugin):
+                self.plugins.extend(module_plugins())
             else:
                 self.plugins.append(plugin)
 
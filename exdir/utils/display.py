@@ -1,31 +1,39 @@
+import io
 import pathlib
 import exdir
 
 
-def _build_tree(o):
-    contents = "<li>"
-    if isinstance(o, exdir.core.File):
-        name = o.root_directory.name
-    else:
-        name = o.object_name
+def _build_tree(o, write):
+    # iterative to avoid deep recursion and quadratic string concatenation,
+    # closing tags are pushed on the stack as plain strings
+    stack = [o]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            write(item)
+            continue
+
+        if isinstance(item, exdir.core.File):
+            name = item.root_directory.name
+        else:
+            name = item.object_name
+
+        write(f"<li>{name} ({item.__class__.__name__})")
+        if isinstance(item, exdir.core.Dataset):
+            write(f"<ul><li>Shape: {item.shape}</li><li>Type: {item.dtype}</li></ul></li>")
+            continue
 
-    contents += f"{name} ({o.__class__.__name__})"
-    if isinstance(o, exdir.core.Dataset):
-        contents += f"<ul><li>Shape: {o.shape}</li><li>Type: {o.dtype}</li></ul>"
-    else:
         try:
-            keys = o.keys()
-            inner_contents = ""
-            for a in keys:
-                inner_contents += _build_tree(o[a])
-            if inner_contents != "":
-                contents += f"<ul>{inner_contents}</ul>"
+            children = [item[a] for a in item.keys()]
         except AttributeError:
-            pass
-
-    contents += "</li>"
+            children = []
 
-    return contents
+        if children:
+            write("<ul>")
+            stack.append("</ul></li>")
+            stack.extend(reversed(children))
+        else:
+            write("</li>")
 
 def html_tree(obj):
     from IPython.core.display import display, HTML
@@ -55,31 +63,42 @@ li.collapsibleListClosed{
     exdir.CollapsibleLists.applyTo(node);
     """
 
-    result = (f"<style>{style}</style>"
-              f"<ul id='{ulid}' class='collapsibleList'>{_build_tree(obj)}</ul>"
-              f"<script>{script}</script>"
-              "")
-
-    return result
-
-
-def _build_attrs_tree(key, value):
-    contents = "<li>"
-    contents += f"{key}: "
-    try:
-        items = value.items()
-        inner_contents = ""
-        for subkey, subvalue in items:
-            inner_contents += _build_attrs_tree(subkey, subvalue)
-        if inner_contents != "":
-            contents += f"<ul>{inner_contents}</ul>"
-    except AttributeError:
-        contents += f"{value}"
-
-    contents += "</li>"
+    with io.StringIO() as buf:
+        buf.write(f"<style>{style}</style>")
+        buf.write(f"<ul id='{ulid}' class='collapsibleList'>")
+        _build_tree(obj, buf.write)
+        buf.write("</ul>")
+        buf.write(f"<script>{script}</script>")
+        return buf.getvalue()
+
+
+def _build_attrs_tree(key, value, write):
+    stack = [(key, value)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            write(item)
+            continue
+
+        key, value = item
+        write(f"<li>{key}: ")
+        try:
+            items = list(value.items())
+        except AttributeError:
+            write(f"{value}</li>")
+            continue
 
-    return contents
+        if items:
+            write("<ul>")
+            stack.append("</ul></li>")
+            stack.extend(reversed(items))
+        else:
+            write("</li>")
 
 
 def html_attrs(attributes):
-    return f"<ul>{_build_attrs_tree('Attributes', attributes)}</ul>"
+    with io.StringIO() as buf:
+        buf.write("<ul>")
+        _build_attrs_tree("Attributes", attributes, buf.write)
+        buf.write("</ul>")
+        return buf.getvalue()
@@ -0,0 +1,54 @@
+import io
+import numpy as np
+
+from exdir.utils import display
+
+
+def _build_tree(obj):
+    with io.StringIO() as buf:
+        display._build_tree(obj, buf.write)
+        return buf.getvalue()
+
+
+def test_build_tree(setup_teardown_file):
+    f = setup_teardown_file[3]
+
+    grp = f.create_group("group")
+    grp.create_dataset("dataset", data=np.arange(3, dtype=np.int64))
+    grp.create_group("empty")
+    sub = grp.create_group("sub")
+    sub.create_dataset("matrix", data=np.zeros((2, 2)))
+    f.create_raw("raw")
+    f.create_dataset("scalar", data=np.float64(1.0))
+
+    assert _build_tree(f) == (
+        "<li>test.exdir (File)<ul>"
+        "<li>group (Group)<ul>"
+        "<li>dataset (Dataset)<ul><li>Shape: (3,)</li><li>Type: int64</li></ul></li>"
+        "<li>empty (Group)</li>"
+        "<li>sub (Group)<ul>"
+        "<li>matrix (Dataset)<ul><li>Shape: (2, 2)</li><li>Type: float64</li></ul></li>"
+        "</ul></li>"
+        "</ul></li>"
+        "<li>raw (Raw)</li>"
+        "<li>scalar (Dataset)<ul><li>Shape: ()</li><li>Type: float64</li></ul></li>"
+        "</ul></li>"
+    )
+
+
+def test_html_attrs(setup_teardown_file):
+    f = setup_teardown_file[3]
+
+    f.attrs["nested"] = {"inner": {"value": 1}, "empty": {}, "text": "hello"}
+    f.attrs["number"] = 3
+
+    assert display.html_attrs(f.attrs) == (
+        "<ul><li>Attributes: <ul>"
+        "<li>nested: <ul>"
+        "<li>inner: <ul><li>value: 1</li></ul></li>"
+        "<li>empty: </li>"
+        "<li>text: hello</li>"
+        "</ul></li>"
+        "<li>number: 3</li>"
+        "</ul></li></ul>"
+    )
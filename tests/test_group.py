@@ -12,6 +12,7 @@
 
 
 import os
+import shutil
 import pytest
 import pathlib
 import numpy as np
@@ -52,6 +53,66 @@ def test_create_group(setup_teardown_file):
     assert isinstance(grp3, Group)
 
 
+def test_create_groups(setup_teardown_file):
+    """Several groups created with a single .create_groups call."""
+
+    f = setup_teardown_file[3]
+    grp = f.create_group("test")
+
+    groups = grp.create_groups(["a", "b/", "c"])
+
+    assert len(groups) == 3
+    assert all(isinstance(g, Group) for g in groups)
+    assert set(grp.keys()) == {"a", "b", "c"}
+
+    with pytest.raises(RuntimeError):
+        grp.create_groups(["d", "A"])
+
+    with pytest.raises(RuntimeError):
+        grp.create_groups(["e", "E"])
+
+    assert set(grp.keys()) == {"a", "b", "c"}
+
+    with pytest.raises(NotImplementedError):
+        grp.create_groups(["f", "g/h", "f"])
+
+    assert set(grp.keys()) == {"a", "b", "c"}
+
+
+@pytest.mark.parametrize("name_validation", [fv.unique, fv.minimal, fv.strict, fv.thorough, fv.none])
+def test_create_groups_validation(setup_teardown_folder, name_validation):
+    """.create_groups checks all names before creating any group."""
+    f = File(setup_teardown_folder[1], name_validation=name_validation)
+    grp = f.create_group("test")
+    grp.create_group("a")
+
+    # the built-in naming rules catch duplicates themselves
+    if name_validation is fv.none:
+        duplicate_error = FileExistsError
+    else:
+        duplicate_error = RuntimeError
+
+    with pytest.raises(duplicate_error):
+        grp.create_groups(["b", "a"])
+
+    with pytest.raises(duplicate_error):
+        grp.create_groups(["b", "b"])
+
+    with pytest.raises(duplicate_error):
+        f.create_groups([""])
+
+    if name_validation is not fv.unique and name_validation is not fv.none:
+        with pytest.raises(NameError):
+            grp.create_groups(["b", "attributes.yaml"])
+
+    assert set(grp.keys()) == {"a"}
+
+    grp.create_groups(["b", "c"])
+    assert set(grp.keys()) == {"a", "b", "c"}
+
+    f.close()
+
+
 def test_len(setup_teardown_file):
     """Simple .create_group call."""
 
@@ -472,6 +533,46 @@ def test_validate_name_simple(setup_teardown_folder):
         grp.create_group("AA")
 
 
+def test_validate_name_thorough_many(setup_teardown_folder):
+    """Test naming rule thorough on groups created in quick succession."""
+    f = File(setup_teardown_folder[1], name_validation=fv.thorough)
+    grp = f.create_group("test")
+
+    for i in range(100):
+        grp.create_group(f"group{i}")
+        with pytest.raises(RuntimeError):
+            grp.create_group(f"Group{i}")
+
+    f.close()
+
+
+def test_validate_name_thorough_unchanged_timestamps(setup_teardown_folder):
+    """
+    Test naming rule thorough when the directory timestamps do not change.
+
+    Regression guard against caching directory listings, which would miss
+    entries that change without changing the directory timestamps.
+    """
+    f = File(setup_teardown_folder[1], name_validation=fv.thorough)
+    grp = f.create_group("test")
+    grp.create_group("x")
+
+    with pytest.raises(RuntimeError):
+        grp.create_group("X")
+
+    # replace x by y and restore the timestamps, like a file system with
+    # coarse timestamps would
+    stat = os.stat(grp.directory)
+    shutil.rmtree(grp.directory / "x")
+    grp.create_group("y")
+    os.utime(grp.directory, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    with pytest.raises(RuntimeError):
+        grp.create_group("Y")
+
+    f.close()
+
+
 def test_validate_name_strict(setup_teardown_folder):
     """Test naming rule strict."""
     f = File(setup_teardown_folder[1], name_validation=fv.strict)
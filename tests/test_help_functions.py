@@ -1,3 +1,4 @@
+import os
 import pathlib
 import quantities as pq
 import numpy as np
@@ -214,3 +215,65 @@ def test_open_object(setup_teardown_file):
     loaded_grp = exob.open_object(path)
 
     assert grp2 == loaded_grp
+
+
+def test_is_case_insensitive(setup_teardown_file):
+    f = setup_teardown_file[3]
+
+    f.create_group("foo")
+    path = setup_teardown_file[1] / "foo"
+    if (path / exob.META_FILENAME.upper()).exists():
+        pytest.skip("The file system is case insensitive.")
+    assert not fv._is_case_insensitive(path)
+    assert not f._case_insensitive_fs
+
+    # a directory where the meta file is found by its upper case name
+    # behaves like one on a case insensitive file system
+    f.create_group("bar")
+    path = setup_teardown_file[1] / "bar"
+    os.link(path / exob.META_FILENAME, path / exob.META_FILENAME.upper())
+    assert fv._is_case_insensitive(path)
+
+    # the check is made once, when the file is opened
+    root = setup_teardown_file[1]
+    os.link(root / exob.META_FILENAME, root / exob.META_FILENAME.upper())
+    assert not f._case_insensitive_fs
+    f.close()
+    assert exdir.File(root, "r")._case_insensitive_fs
+
+
+@pytest.mark.parametrize("rule", [fv.unique, fv.minimal, fv.strict, fv.thorough, fv.none])
+def test_validate_many(setup_teardown_folder, rule):
+    parent_path = setup_teardown_folder[0]
+    (parent_path / "existing").mkdir()
+
+    names = [
+        "new", "existing", "EXISTING", "", ".", "..", "x y", "A",
+        exob.META_FILENAME, "con", "\n", chr(0x4500),
+    ]
+
+    # validating one name at a time gives the same result as the rule
+    for name in names:
+        try:
+            rule(parent_path, name)
+            expected = None
+        except (NameError, RuntimeError) as e:
+            expected = type(e)
+
+        if expected is None:
+            fv.validate_many(parent_path, [name], rule)
+        else:
+            with pytest.raises(expected):
+                fv.validate_many(parent_path, [name], rule)
+
+    # names are also checked against each other
+    if rule is fv.none:
+        fv.validate_many(parent_path, ["new", "new"], rule)
+    else:
+        with pytest.raises(RuntimeError):
+            fv.validate_many(parent_path, ["new", "new"], rule)
+
+    # the first invalid name decides the error
+    if rule is fv.strict:
+        with pytest.raises(RuntimeError):
+            fv.validate_many(parent_path, ["", "x y"], rule)
@@ -75,6 +75,45 @@ def test_plugin_order():
     assert(names == ["first", "second", "third", "fourth", "fifth"])
 
 
+def test_plugin_order_ties():
+    def plugin(name, **kwargs):
+        return exdir.plugin_interface.Plugin(
+            name,
+            dataset_plugins=[exdir.plugin_interface.Dataset()],
+            **kwargs
+        )
+
+    # plugins without constraints between them keep the order they were given
+    plugins = [
+        plugin("first"),
+        plugin("second", write_after=["third"]),
+        plugin("third"),
+        plugin("fourth", write_after=["first"]),
+    ]
+
+    manager = exdir.plugin_interface.plugin_interface.Manager(plugins)
+
+    names = [plugin._plugin_module.name for plugin in manager.dataset_plugins.write_order]
+    assert(names == ["first", "third", "second", "fourth"])
+
+
+def test_plugin_order_circular():
+    first = exdir.plugin_interface.Plugin(
+        "first",
+        write_after=["second"],
+        dataset_plugins=[exdir.plugin_interface.Dataset()]
+    )
+
+    second = exdir.plugin_interface.Plugin(
+        "second",
+        write_after=["first"],
+        dataset_plugins=[exdir.plugin_interface.Dataset()]
+    )
+
+    with pytest.raises(ValueError):
+        exdir.plugin_interface.plugin_interface.Manager([first, second])
+
+
 def test_noop(setup_teardown_folder):
     class DatasetPlugin(exdir.plugin_interface.Dataset):
         def prepare_read(self, dataset_data):